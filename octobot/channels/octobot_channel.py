@@ -14,6 +14,8 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+
 import async_channel.constants as channel_constants
 import async_channel.channels as channels
 import async_channel.consumer as consumers
@@ -39,13 +41,29 @@ class OctoBotChannelProducer(producers.Producer):
         await self.start()
 
     async def send(self, bot_id, subject, action, data=None):
-        for consumer in self.channel.get_filtered_consumers(bot_id=bot_id, subject=subject, action=action):
-            await consumer.queue.put({
-                "bot_id": bot_id,
-                "subject": subject,
-                "action": action,
-                "data": data
-            })
+        filtered_consumers = self.channel.get_filtered_consumers(bot_id=bot_id, subject=subject, action=action)
+        if not filtered_consumers:
+            # nobody listens to this event
+            return
+        # shared by every consumer: Consumer.perform() unpacks it as callback kwargs and never mutates it
+        payload = {
+            "bot_id": bot_id,
+            "subject": subject,
+            "action": action,
+            "data": data
+        }
+        pending_puts = []
+        for consumer in filtered_consumers:
+            if consumer.queue.full():
+                # bounded queue: wait for a free slot, full queues are awaited together
+                pending_puts.append(consumer.queue.put(payload))
+            else:
+                # same as queue.put() when a slot is available, without creating a coroutine per consumer
+                consumer.queue.put_nowait(payload)
+        if len(pending_puts) == 1:
+            await pending_puts[0]
+        elif pending_puts:
+            await asyncio.gather(*pending_puts)
 
 
 class OctoBotChannel(channels.Channel):
@@ -64,6 +82,8 @@ class OctoBotChannel(channels.Channel):
         super().__init__()
         self.chan_id = bot_id
         self.is_synchronized = True
+        # filtered consumers by (bot_id, subject, action), reset when consumers are added or removed
+        self._filtered_consumers_cache = {}
 
     async def new_consumer(self,
                            callback: object = None,
@@ -93,17 +113,47 @@ class OctoBotChannel(channels.Channel):
                                action: str = channel_constants.CHANNEL_WILDCARD):
         """
         Returns the consumer that matches criteria
+        Results are cached until consumers are added or removed: the returned list should not be modified
         :param subject: the subject criteria
         :param bot_id: the bot id criteria
         :param action: the action criteria
         :return: the matched consumers list
         """
+        cache_key = (bot_id, subject, action)
+        try:
+            return self._filtered_consumers_cache[cache_key]
+        except KeyError:
+            filtered_consumers = self._filtered_consumers_cache[cache_key] = \
+                self._get_consumers_from_criteria(bot_id, subject, action)
+            return filtered_consumers
+        except TypeError:
+            # unhashable criteria (ex: list of actions): can't be cached
+            return self._get_consumers_from_criteria(bot_id, subject, action)
+
+    def _get_consumers_from_criteria(self, bot_id, subject, action):
         return self.get_consumer_from_filters({
             self.BOT_ID_KEY: bot_id,
             self.SUBJECT_KEY: subject,
             self.ACTION_KEY: action
         })
 
+    def add_new_consumer(self, consumer, consumer_filters) -> None:
+        """
+        Add a new consumer and reset filtered consumers cache
+        :param consumer: the consumer to add
+        :param consumer_filters: the consumer selection filters
+        """
+        super().add_new_consumer(consumer, consumer_filters)
+        self._filtered_consumers_cache.clear()
+
+    async def remove_consumer(self, consumer: OctoBotChannelConsumer) -> None:
+        """
+        Remove a consumer and reset filtered consumers cache
+        :param consumer: the consumer to remove
+        """
+        self._filtered_consumers_cache.clear()
+        await super().remove_consumer(consumer)
+
     async def _add_new_consumer_and_run(self, consumer,
                                         bot_id: object = channel_constants.CHANNEL_WILDCARD,
                                         subject: object = channel_constants.CHANNEL_WILDCARD,
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import functools
 import logging
 import os
 import shutil
@@ -42,6 +43,18 @@ BOT_CHANNEL_LOGGER = None
 LOGGER_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value
 
 
+def _debug_log_callback(callback):
+    """
+    Channel log callbacks decorator: skips the callback, and therefore its log message formatting,
+    when debug logs of the OctoBot Channel logger are filtered out
+    """
+    @functools.wraps(callback)
+    async def _debug_enabled_callback(*args, **kwargs):
+        if BOT_CHANNEL_LOGGER.logger.isEnabledFor(logging.DEBUG):
+            await callback(*args, **kwargs)
+    return _debug_enabled_callback
+
+
 def _log_uncaught_exceptions(ex_cls, ex, tb):
     logging.exception("".join(traceback.format_tb(tb)))
     logging.exception("{0}: {1}".format(ex_cls, ex))
@@ -158,7 +171,8 @@ async def init_exchange_chan_logger(exchange_id):
         )
         await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.BALANCE_PROFITABILITY_CHANNEL.value,
                                          exchange_id).new_consumer(
-            balance_profitability_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
+            create_balance_profitability_callback(),
+            priority_level=channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value
         )
 
 
@@ -182,6 +196,7 @@ async def init_octobot_chan_logger(bot_id: str):
     )
 
 
+@_debug_log_callback
 async def ticker_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, ticker
 ):
@@ -191,6 +206,7 @@ async def ticker_callback(
     )
 
 
+@_debug_log_callback
 async def mini_ticker_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, mini_ticker
 ):
@@ -200,6 +216,7 @@ async def mini_ticker_callback(
     )
 
 
+@_debug_log_callback
 async def order_book_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, asks, bids
 ):
@@ -209,6 +226,7 @@ async def order_book_callback(
     )
 
 
+@_debug_log_callback
 async def order_book_ticker_callback(
         exchange: str,
         exchange_id: str,
@@ -226,6 +244,7 @@ async def order_book_ticker_callback(
     )
 
 
+@_debug_log_callback
 async def ohlcv_callback(
         exchange: str,
         exchange_id: str,
@@ -240,6 +259,7 @@ async def ohlcv_callback(
     )
 
 
+@_debug_log_callback
 async def recent_trades_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, recent_trades
 ):
@@ -249,6 +269,7 @@ async def recent_trades_callback(
     )
 
 
+@_debug_log_callback
 async def liquidations_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, liquidations
 ):
@@ -258,6 +279,7 @@ async def liquidations_callback(
     )
 
 
+@_debug_log_callback
 async def kline_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, time_frame, kline
 ):
@@ -267,6 +289,7 @@ async def kline_callback(
     )
 
 
+@_debug_log_callback
 async def mark_price_callback(
         exchange: str, exchange_id: str, cryptocurrency: str, symbol: str, mark_price
 ):
@@ -291,6 +314,7 @@ def _filter_balance(balance: dict):
     return balance, 0
 
 
+@_debug_log_callback
 async def balance_callback(exchange: str, exchange_id: str, balance):
     filtered_balance, filtered_count = _filter_balance(balance)
     BOT_CHANNEL_LOGGER.debug(
@@ -298,20 +322,38 @@ async def balance_callback(exchange: str, exchange_id: str, balance):
     )
 
 
-async def balance_profitability_callback(
-        exchange: str,
-        exchange_id: str,
-        profitability,
-        profitability_percent,
-        market_profitability_percent,
-        initial_portfolio_current_profitability,
-):
-    BOT_CHANNEL_LOGGER.debug(
-        f"BALANCE PROFITABILITY : EXCHANGE = {exchange} || PROFITABILITY = "
-        f"{pretty_printer.portfolio_profitability_pretty_print(profitability, profitability_percent, 'USDT')}"
-    )
+def create_balance_profitability_callback():
+    """
+    :return: a balance profitability callback to be registered for a single exchange: it keeps the last logged
+    profitability to skip unchanged profitability logs, this state is released with the exchange channel consumer
+    """
+    # last logged (profitability, profitability_percent)
+    last_logged_profitability = None
+
+    @_debug_log_callback
+    async def balance_profitability_callback(
+            exchange: str,
+            exchange_id: str,
+            profitability,
+            profitability_percent,
+            market_profitability_percent,
+            initial_portfolio_current_profitability,
+    ):
+        nonlocal last_logged_profitability
+        logged_profitability = (profitability, profitability_percent)
+        if last_logged_profitability == logged_profitability:
+            # unchanged since last log: skip pretty printing and duplicated log line
+            return
+        last_logged_profitability = logged_profitability
+        BOT_CHANNEL_LOGGER.debug(
+            f"BALANCE PROFITABILITY : EXCHANGE = {exchange} || PROFITABILITY = "
+            f"{pretty_printer.portfolio_profitability_pretty_print(profitability, profitability_percent, 'USDT')}"
+        )
+
+    return balance_profitability_callback
 
 
+@_debug_log_callback
 async def trades_callback(
         exchange: str,
         exchange_id: str,
@@ -327,6 +369,7 @@ async def trades_callback(
     )
 
 
+@_debug_log_callback
 async def orders_callback(
         exchange: str,
         exchange_id: str,
@@ -343,6 +386,7 @@ async def orders_callback(
     BOT_CHANNEL_LOGGER.debug(order_string)
 
 
+@_debug_log_callback
 async def positions_callback(
         exchange: str,
         exchange_id: str,
@@ -354,6 +398,7 @@ async def positions_callback(
     BOT_CHANNEL_LOGGER.debug(f"POSITIONS : EXCHANGE = {exchange} || POSITIONS = {position}")
 
 
+@_debug_log_callback
 async def funding_callback(
         exchange: str,
         exchange_id: str,
@@ -371,6 +416,7 @@ async def funding_callback(
     )
 
 
+@_debug_log_callback
 async def matrix_callback(
         matrix_id,
         evaluator_name,
@@ -390,6 +436,7 @@ async def matrix_callback(
     )
 
 
+@_debug_log_callback
 async def evaluators_callback(
         matrix_id,
         evaluator_name,
@@ -408,6 +455,7 @@ async def evaluators_callback(
     )
 
 
+@_debug_log_callback
 async def octobot_channel_callback(
         bot_id: str,
         subject: str,
@@ -0,0 +1,142 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import pytest
+import pytest_asyncio
+
+import async_channel.constants as channel_constants
+import octobot_commons.asyncio_tools as asyncio_tools
+
+import octobot.channels as octobot_channel
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+BOT_ID = "bot_id"
+
+
+@pytest_asyncio.fixture
+async def channel():
+    channel = octobot_channel.OctoBotChannel(BOT_ID)
+    try:
+        yield channel
+    finally:
+        for consumer in channel.get_consumers():
+            await channel.remove_consumer(consumer)
+
+
+def _recording_callback(received):
+    async def callback(bot_id, subject, action, data):
+        received.append(data)
+    return callback
+
+
+async def test_get_filtered_consumers_cache_reset_on_new_consumer(channel):
+    producer = octobot_channel.OctoBotChannelProducer(channel)
+    # cache an empty result before any consumer exists
+    await producer.send(BOT_ID, "subject", "action", 0)
+    assert channel.get_filtered_consumers(BOT_ID, "subject", "action") == []
+    assert channel._filtered_consumers_cache == {(BOT_ID, "subject", "action"): []}
+
+    received = []
+    consumer = await channel.new_consumer(_recording_callback(received), bot_id=BOT_ID)
+    assert channel._filtered_consumers_cache == {}
+    assert channel.get_filtered_consumers(BOT_ID, "subject", "action") == [consumer]
+    await producer.send(BOT_ID, "subject", "action", 1)
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert received == [1]
+
+
+async def test_get_filtered_consumers_with_list_filters(channel):
+    producer = octobot_channel.OctoBotChannelProducer(channel)
+    received = []
+    await channel.new_consumer(_recording_callback(received), bot_id=BOT_ID, subject=["subject_1", "subject_2"])
+    await producer.send(BOT_ID, "subject_1", "action", 1)
+    await producer.send(BOT_ID, "subject_3", "action", 2)
+    await producer.send(BOT_ID, "subject_2", "action", 3)
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert received == [1, 3]
+
+
+async def test_get_filtered_consumers_cache_reset_on_removed_consumer(channel):
+    producer = octobot_channel.OctoBotChannelProducer(channel)
+    received_1 = []
+    received_2 = []
+    await channel.new_consumer(_recording_callback(received_1), bot_id=BOT_ID)
+    consumer_2 = await channel.new_consumer(_recording_callback(received_2), bot_id=BOT_ID)
+    await producer.send(BOT_ID, "subject", "action", 1)
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert received_1 == received_2 == [1]
+
+    await channel.remove_consumer(consumer_2)
+    assert channel._filtered_consumers_cache == {}
+    await producer.send(BOT_ID, "subject", "action", 2)
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert received_1 == [1, 2]
+    assert received_2 == [1]
+
+
+async def test_get_filtered_consumers_with_unhashable_criteria(channel):
+    consumer = await channel.new_consumer(_recording_callback([]), bot_id=BOT_ID)
+    await channel.new_consumer(_recording_callback([]), bot_id="other_bot_id")
+    assert channel.get_filtered_consumers(BOT_ID, action=["action_1", "action_2"]) == [consumer]
+    assert channel.get_filtered_consumers(BOT_ID, subject=channel_constants.CHANNEL_WILDCARD,
+                                          action=["action_1"]) == [consumer]
+    # not cached
+    assert channel._filtered_consumers_cache == {}
+
+
+async def _wait_cycles(count=10):
+    for _ in range(count):
+        await asyncio_tools.wait_asyncio_next_cycle()
+
+
+async def test_send_to_full_bounded_queues(channel):
+    producer = octobot_channel.OctoBotChannelProducer(channel)
+    received_slow = []
+    received_fast = []
+    slow_release = asyncio.Event()
+    fast_release = asyncio.Event()
+
+    def _blocking_callback(received, release_event):
+        async def callback(bot_id, subject, action, data):
+            await release_event.wait()
+            received.append(data)
+        return callback
+
+    await channel.new_consumer(_blocking_callback(received_slow, slow_release), size=1, bot_id=BOT_ID)
+    await channel.new_consumer(_blocking_callback(received_fast, fast_release), size=1, bot_id=BOT_ID)
+    # both consumers are blocked in their callback with event 0
+    await producer.send(BOT_ID, "subject", "action", 0)
+    await _wait_cycles()
+    # event 1 fills both queues
+    await producer.send(BOT_ID, "subject", "action", 1)
+    # event 2 has to wait for both queues
+    send_task = asyncio.create_task(producer.send(BOT_ID, "subject", "action", 2))
+    await _wait_cycles()
+    assert not send_task.done()
+
+    # the fast consumer gets every event while the slow one is still blocked
+    fast_release.set()
+    await _wait_cycles()
+    assert received_fast == [0, 1, 2]
+    assert received_slow == []
+    assert not send_task.done()
+
+    slow_release.set()
+    await asyncio.wait_for(send_task, 1)
+    await _wait_cycles()
+    assert received_slow == [0, 1, 2]
@@ -0,0 +1,88 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import decimal
+import logging
+
+import mock
+import pytest
+
+import octobot.logger as logger
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def bot_channel_logger():
+    bot_channel_logger = mock.Mock()
+    bot_channel_logger.logger.isEnabledFor = mock.Mock(side_effect=lambda level: level >= logging.DEBUG)
+    with mock.patch.object(logger, "BOT_CHANNEL_LOGGER", bot_channel_logger):
+        yield bot_channel_logger
+
+
+async def _call_balance_profitability_callback(callback, profitability, profitability_percent):
+    await callback(
+        exchange="binance",
+        exchange_id="exchange_id",
+        profitability=profitability,
+        profitability_percent=profitability_percent,
+        market_profitability_percent=decimal.Decimal("0"),
+        initial_portfolio_current_profitability=decimal.Decimal("0"),
+    )
+
+
+async def test_balance_profitability_callback_skips_unchanged_profitability(bot_channel_logger):
+    callback = logger.create_balance_profitability_callback()
+    await _call_balance_profitability_callback(callback, decimal.Decimal("10"), decimal.Decimal("1"))
+    bot_channel_logger.debug.assert_called_once()
+    await _call_balance_profitability_callback(callback, decimal.Decimal("10"), decimal.Decimal("1"))
+    bot_channel_logger.debug.assert_called_once()
+    await _call_balance_profitability_callback(callback, decimal.Decimal("12"), decimal.Decimal("1.2"))
+    assert bot_channel_logger.debug.call_count == 2
+    # back to a previous value: logged again
+    await _call_balance_profitability_callback(callback, decimal.Decimal("10"), decimal.Decimal("1"))
+    assert bot_channel_logger.debug.call_count == 3
+
+    # each exchange callback has its own state
+    other_callback = logger.create_balance_profitability_callback()
+    await _call_balance_profitability_callback(other_callback, decimal.Decimal("10"), decimal.Decimal("1"))
+    assert bot_channel_logger.debug.call_count == 4
+
+
+async def test_exchange_callbacks_skip_formatting_when_debug_is_filtered(bot_channel_logger):
+    order = {"status": "open"}
+    balance = {"BTC": {"total": decimal.Decimal("1")}}
+    with mock.patch.object(logger.pretty_printer, "open_order_pretty_printer", mock.Mock(return_value="order")) \
+            as open_order_pretty_printer_mock, \
+            mock.patch.object(logger, "_filter_balance", mock.Mock(return_value=(balance, 0))) \
+            as _filter_balance_mock:
+        bot_channel_logger.logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+        await logger.orders_callback("binance", "exchange_id", "BTC", "BTC/USDT", order, "update", True)
+        await logger.balance_callback("binance", "exchange_id", balance)
+        await logger.evaluators_callback("matrix_id", "eval", "type", "binance", "BTC", "BTC/USDT", "1h", {})
+        await logger.ticker_callback("binance", "exchange_id", "BTC", "BTC/USDT", {})
+        open_order_pretty_printer_mock.assert_not_called()
+        _filter_balance_mock.assert_not_called()
+        bot_channel_logger.debug.assert_not_called()
+
+        bot_channel_logger.logger.isEnabledFor.side_effect = lambda level: level >= logging.DEBUG
+        await logger.orders_callback("binance", "exchange_id", "BTC", "BTC/USDT", order, "update", True)
+        await logger.balance_callback("binance", "exchange_id", balance)
+        await logger.evaluators_callback("matrix_id", "eval", "type", "binance", "BTC", "BTC/USDT", "1h", {})
+        await logger.ticker_callback("binance", "exchange_id", "BTC", "BTC/USDT", {})
+        open_order_pretty_printer_mock.assert_called_once_with("binance", order)
+        _filter_balance_mock.assert_called_once_with(balance)
+        assert bot_channel_logger.debug.call_count == 4